@@ -1,6 +1,4 @@
 import logging
-import string
-from tokenize import String
 import unittest
 import os
 import os.path
@@ -9,6 +7,20 @@ import debug_backend as dbg
 from debug_backend_tests import *
 import gzip
 import json
+import array
+import bisect
+import functools
+import operator
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+try:
+    # only C backend is worth it, pure Python ones are slower than loading the whole JSON
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    ijson = None
 
 
 def get_logger():
@@ -21,6 +33,125 @@ class GcovDataError(RuntimeError):
     pass
 
 MAIN_COMP_BUILD_DIR_NAME = "__idf_main.dir"
+GCOV_READ_BUF_SIZE = 128*1024
+# fetches all fields of gcov JSON line record needed by parser in one call
+_line_fields = operator.itemgetter('function_name', 'line_number', 'count', 'branches')
+
+def gcov_batch(toolchain, paths):
+    """ Runs gcov once for all specified data files.
+        Returns the list of '*.gcov.json.gz' files produced in the current dir, one per data file.
+    """
+    cmd = ['%sgcov' % toolchain, '-j', *paths]
+    if get_logger().isEnabledFor(logging.DEBUG):
+        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
+        get_logger().debug('GCOV: %s', out)
+    else:
+        # do not capture output which is not logged, keep only stderr for CalledProcessError
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+    # remove .gcda extension
+    return ['%s.gcov.json.gz' % os.path.splitext(os.path.basename(p))[0] for p in paths]
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_fname(fname, proj_path, build_path, idf_path):
+    """ Converts source file path from gcov data to '$IDF_PATH/...' or '$PROJECT_PATH/...' form
+    """
+    if fname.startswith('$PROJECT_PATH') or fname.startswith('$IDF_PATH'):
+        return fname
+    if not os.path.isabs(fname):
+        # path relative to the build dir
+        fname = os.path.normpath(os.path.join(build_path, fname))
+    get_logger().debug('SRC FILE "%s"', fname)
+    if idf_path and fname.startswith(idf_path):
+        get_logger().debug('IDF_PREF "%s"', idf_path)
+        return '$IDF_PATH' + fname[len(idf_path):]
+    if fname.startswith(proj_path):
+        get_logger().debug('PROJ_PREF "%s"', proj_path)
+        return '$PROJECT_PATH' + fname[len(proj_path):]
+    return fname
+
+def create_data_dict(data, fname, proj_path, build_path='', idf_path=''):
+    fname = _normalize_fname(fname, proj_path, build_path, idf_path)
+    # line and branch info is stored as columns: 'lc' - (line numbers, exec counts), 'br' - (line numbers, taken flags)
+    data[fname] = {'funcs': {}, 'lc': (array.array('i'), array.array('q')), 'br': (array.array('i'), array.array('B'))}
+    return fname
+
+def _iter_gcov_files(path):
+    """ Yields source file records from gcov JSON file ('*.json' or '*.gcov.json.gz' produced by gcov_batch())
+    """
+    opener = open if path.endswith('.json') else gzip.open
+    with opener(path, 'rb') as f:
+        if ijson:
+            # stream file records one by one instead of building the whole JSON tree in memory
+            yield from ijson.items(f, 'files.item', buf_size=GCOV_READ_BUF_SIZE)
+            return
+        # read (and decompress) the whole file in one shot instead of many small reads
+        data = f.read()
+    yield from json_loads(data)["files"]
+
+def get_gcov_lines_coverage(path, src_path, ranges, proj_path, build_path=''):
+    """ Returns exec counts for lines of source file without building full GcovDataFile.
+        'ranges' is a dict with (start, end) lines ranges, result is a dict with the same keys
+        and lists of (line, count) pairs. Like GcovDataFile.get_lines_coverage() it does not include
+        functions' first lines.
+    """
+    lines_cov = {key: [] for key in ranges}
+    if not (src_path.startswith('$PROJECT_PATH')):
+        src_path = src_path.replace(proj_path, '$PROJECT_PATH')
+    idf_path = os.environ.get('IDF_PATH', '')
+    for each_files in _iter_gcov_files(path):
+        if _normalize_fname(str(each_files['file']), proj_path, build_path, idf_path) != src_path:
+            continue
+        func_names = set()
+        for each_lines in each_files["lines"]:
+            func_name = each_lines["function_name"]
+            if func_name not in func_names:
+                func_names.add(func_name)
+                continue
+            ln = each_lines["line_number"]
+            for key, (start, end) in ranges.items():
+                if ln >= start and ln <= end:
+                    lines_cov[key].append((ln, each_lines["count"]))
+    return lines_cov
+
+def _load_gcov(toolchain, path, proj_path, build_path='', data=None):
+    """ Parses GCOV data file and returns coverage info dict keyed by source file name.
+        If 'data' is specified it is filled in instead of a newly allocated dict.
+    """
+    if data is None:
+        data = {}
+    idf_path = os.environ.get('IDF_PATH', '')
+    get_logger().debug('Process gcov file "%s"', path)
+    dir_name,file_name = os.path.split(path)
+    get_logger().debug('Gcov file dir "%s" filename "%s"', dir_name, file_name)
+    _,file_ext = os.path.splitext(file_name)
+    # get_logger().debug('Gcov filename "%s" ext "%s"', fname, file_ext)
+    if file_ext not in ('.json', '.gz'):
+        path = gcov_batch(toolchain, [path])[0]
+    for each_files in _iter_gcov_files(path):
+        fname = str(each_files['file'])
+        fname = create_data_dict(data, fname, proj_path, build_path, idf_path)
+        cur = data[fname]
+        funcs = cur['funcs']
+        lc_lines, lc_counts = cur['lc']
+        br_lines, br_taken = cur['br']
+        func_names = set()
+        for each_lines in each_files["lines"]:
+            func_name, ln, cnt, branches = _line_fields(each_lines)
+            if func_name not in func_names:
+                func_names.add(func_name)
+                funcs[func_name] = {'sl' : ln, 'ec' : cnt}
+            else:
+                lc_lines.append(ln)
+                lc_counts.append(cnt)
+            if branches:
+                # add all line's branches to columns at once
+                br_lines.extend([ln] * len(branches))
+                br_taken.extend([each_branch["count"] != 0 for each_branch in branches])
+    return data
+
+# Reference '*.gcov.json' files do not change during test run, so parse every one of them only once.
+# NOTE: returned dict is shared between all users, so it must not be modified.
+_load_gcov_ref = functools.lru_cache(maxsize=32)(_load_gcov)
 
 class GcovDataFile:
     """ GCOV data file wrapper
@@ -31,66 +162,29 @@ class GcovDataFile:
     GCOV_BRANCH_TAG = 'branch:'
     GCOV_VERSION_TAG = 'version:'
 
-    def create_data_dict(self, fname, proj_path, build_path=''):
-        if not (fname.startswith('$PROJECT_PATH') or fname.startswith('$IDF_PATH')):
-            if not os.path.isabs(fname):
-                # path relative to the build dir
-                fname = os.path.normpath(os.path.join(build_path, fname))
-            idf_path = os.getenv('IDF_PATH', '')
-            get_logger().debug('SRC FILE "%s"', fname)
-            prefix = os.path.commonprefix([idf_path, fname])
-            get_logger().debug('IDF_PREF "%s" "%s"', idf_path, prefix)
-            if prefix and prefix == idf_path:
-                fname = '$IDF_PATH' + fname[len(prefix):]
-            else:
-                prefix = os.path.commonprefix([proj_path, fname])
-                get_logger().debug('PROJ_PREF "%s" "%s"', proj_path, prefix)
-                if prefix == proj_path:
-                    fname = '$PROJECT_PATH' + fname[len(prefix):]
-        self.data[fname] = {'funcs': {}, 'lc': [], 'br': []}
-        self._cur_file = fname
-        return fname
-
     def __init__(self, toolchain, path, src_dirs, proj_path, build_path=''):
-        self._path = path
-        self.data = {}
+        self._toolchain = toolchain
         self.src_dirs = src_dirs
-        self._cur_file = ''
+        self._src_dir_prefixes = tuple(d if d.endswith(os.sep) else d + os.sep for d in src_dirs)
         self.proj_path = proj_path
-        get_logger().debug('Process gcov file "%s"', path)
-        dir_name,file_name = os.path.split(path)
-        get_logger().debug('Gcov file dir "%s" filename "%s"', dir_name, file_name)
-        _,file_ext = os.path.splitext(file_name)
-        # get_logger().debug('Gcov filename "%s" ext "%s"', fname, file_ext)
-        if file_ext == '.json':
-            gcov_name = path
-            f = open(path)
+        self.data = None
+        # True when 'data' is shared with cached reference data and can not be modified
+        self._shared_data = False
+        self.reload(path, build_path)
+
+    def reload(self, path, build_path=''):
+        """ Loads data from another GCOV data file into this object, reusing its data dict if possible
+        """
+        self._path = path
+        if path.endswith('.json'):
+            self.data = _load_gcov_ref(self._toolchain, path, self.proj_path, build_path)
+            self._shared_data = True
+        elif self.data is None or self._shared_data:
+            self.data = _load_gcov(self._toolchain, path, self.proj_path, build_path)
+            self._shared_data = False
         else:
-            out = subprocess.check_output(['%sgcov' % toolchain, '-j', path], stderr=subprocess.STDOUT)
-            get_logger().debug('GCOV: %s', out)
-            gcov_gz_file = os.path.splitext(file_name)[0] # remove .gcda extension.
-            gcov_name = '%s.gcov.json.gz' % gcov_gz_file
-            f = gzip.open(gcov_name, 'rb')
-        json_file = json.load(f)
-        for each_files in  json_file["files"]:
-            fname = str(each_files['file'])
-            fname = self.create_data_dict(fname, proj_path, build_path)
-            func_names = []
-            for each_lines in each_files["lines"]:
-                if not each_lines["function_name"] in func_names:
-                    func_names.append(each_lines["function_name"])
-                    self.data[self._cur_file]['funcs'][each_lines["function_name"]] = {'sl' : each_lines["line_number"], 'ec' : each_lines["count"]}
-                else:
-                    self.data[self._cur_file]['lc'].append([each_lines["line_number"], each_lines["count"]])
-                if each_lines["branches"] is not None:
-                    for each_branch in each_lines["branches"]:
-                        branch_stat = ''
-                        if each_branch["count"] == 0:
-                            branch_stat = 'nottaken'
-                        else:
-                            branch_stat = 'taken'
-                        self.data[self._cur_file]['br'].append([each_lines["line_number"], branch_stat])
-        f.close()
+            self.data.clear()
+            _load_gcov(self._toolchain, path, self.proj_path, build_path, self.data)
 
     def __eq__(self, other):
         for fname in self.data:
@@ -98,22 +192,14 @@ class GcovDataFile:
             if fname not in other.data:
                 get_logger().error('Check Gcov fname: %s not in %s (%s)', fname, other.data.keys(), other._path)
                 return False
-            in_src_dirs = False
-            for d in self.src_dirs:
-                if os.path.commonprefix([d, fname]) == d:
-                    in_src_dirs = True
-                    break
-            if not in_src_dirs:
+            if not fname.startswith(self._src_dir_prefixes):
                 continue
-            for func in self.data[fname]['funcs']:
-                if func not in other.data[fname]['funcs']:
-                    return False
-            for i in range(len(self.data[fname]['lc'])):
-                if self.data[fname]['lc'][i][0] != other.data[fname]['lc'][i][0] or self.data[fname]['lc'][i][1] != other.data[fname]['lc'][i][1]:
-                    return False
-            for i in range(len(self.data[fname]['br'])):
-                if self.data[fname]['br'][i][0] != other.data[fname]['br'][i][0] or self.data[fname]['br'][i][1] != other.data[fname]['br'][i][1]:
-                    return False
+            if not set(self.data[fname]['funcs']).issubset(other.data[fname]['funcs']):
+                return False
+            if self.data[fname]['lc'] != other.data[fname]['lc']:
+                return False
+            if self.data[fname]['br'] != other.data[fname]['br']:
+                return False
         return True
 
     def __repr__(self):
@@ -124,10 +210,11 @@ class GcovDataFile:
         if not (fname.startswith('$PROJECT_PATH')):
             fname = fname.replace(self.proj_path, '$PROJECT_PATH')
         if fname in self.data:
-            for i in range(len(self.data[fname]['lc'])):
-                ln = int(self.data[fname]['lc'][i][0])
-                if ln >= start and ln <= end:
-                    lines_cov.append((int(self.data[fname]['lc'][i][0]), int(self.data[fname]['lc'][i][1])))
+            lines, counts = self.data[fname]['lc']
+            # gcov reports lines in ascending order, so find the range bounds by binary search
+            lo = bisect.bisect_left(lines, start)
+            hi = bisect.bisect_right(lines, end)
+            lines_cov = list(zip(lines[lo:hi], counts[lo:hi]))
         return lines_cov
 
 
@@ -169,48 +256,53 @@ class GcovTestsImpl:
 
     def setUp(self):
         self.gcov_files = []
+        obj_dir = self.test_app_cfg.build_obj_dir()
+        src_dir = self.test_app_cfg.build_src_dir()
+        self.obj_dir = obj_dir
         # for test app project path is two level higher than build dir
-        self.proj_path = os.path.normpath(os.path.join(self.test_app_cfg.build_obj_dir(), '..', '..'))
-        self.gcov_prefix = os.getenv('OPENOCD_GCOV_PREFIX', self.test_app_cfg.build_obj_dir())
-        self.src_dirs = [self.test_app_cfg.build_src_dir(),]
-        src_path = os.path.join(self.test_app_cfg.build_src_dir(), 'main', 'gcov_tests.c')
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'gcov_tests.c.gcda')
+        self.proj_path = os.path.normpath(os.path.join(obj_dir, '..', '..'))
+        self.gcov_prefix = os.getenv('OPENOCD_GCOV_PREFIX', obj_dir)
+        self.src_dirs = [src_dir,]
+        data_dir = os.path.join(obj_dir, 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME)
+        # paths to data files dumped from target
+        self._gcda_paths = {}
+        for name in ('gcov_tests', 'helper_funcs'):
+            self._gcda_paths[name] = os.path.join(self.gcov_prefix, self.strip_gcov_path(os.path.join(data_dir, '%s.c.gcda' % name)))
         # remove old data files to avoid "Data file mismatch" error. 
         # this kind of errors/warnings causes stack overflow issue for the "gcov_dump_task" 
-        stripped_data_dir = os.path.dirname(os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path)))
-        files = os.listdir(stripped_data_dir)
-        for file in files:
-            if file.endswith(".gcda"):
-                os.remove(os.path.join(stripped_data_dir, file))
-        ref_data_path = os.path.join(self.test_app_cfg.build_src_dir(), 'main', 'gcov_tests.c.gcov.json')
-        ref_data = GcovDataFile(self.toolchain, ref_data_path, self.src_dirs, self.proj_path)
-        self.gcov_files.append({
-            'src_path' : src_path,
-            'data_path' : os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path)),
-            'ref_data' : ref_data,
-            # lines executed only once
-            'c_lines' : ref_data.get_lines_coverage(src_path, self.CONST_LINES_START[0], self.CONST_LINES_END[0]),
-            # lines executed every gcov dump cycle
-            'd_lines' : ref_data.get_lines_coverage(src_path, self.DYN_LINES_START[0], self.DYN_LINES_END[0])
-            })
-        src_path = os.path.join(self.test_app_cfg.build_src_dir(), 'main', 'helper_funcs.c')
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'helper_funcs.c.gcda')
-        ref_data_path = os.path.join(self.test_app_cfg.build_src_dir(), 'main', 'helper_funcs.c.gcov.json')
-        ref_data = GcovDataFile(self.toolchain, ref_data_path, self.src_dirs, self.proj_path)
-        self.gcov_files.append({
-            'src_path' : src_path,
-            'data_path' : os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path)),
-            'ref_data' : ref_data,
-            # lines executed only once
-            'c_lines' : None,
-            # lines executed every gcov dump cycle
-            'd_lines' : ref_data.get_lines_coverage(src_path, self.DYN_LINES_START[1], self.DYN_LINES_END[1])
-            })
+        stripped_data_dir = os.path.dirname(self._gcda_paths['gcov_tests'])
+        with os.scandir(stripped_data_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".gcda"):
+                    os.remove(entry.path)
+        for name in ('gcov_tests', 'helper_funcs'):
+            ref_data_path = os.path.join(src_dir, 'main', '%s.c.gcov.json' % name)
+            self.gcov_files.append({
+                'src_path' : os.path.join(src_dir, 'main', '%s.c' % name),
+                'data_path' : self._gcda_paths[name],
+                # reference data are needed by test_simple_xxx tests only, so they are loaded on first use by _ref()
+                'ref_data_loader' : lambda path=ref_data_path: GcovDataFile(self.toolchain, path, self.src_dirs, self.proj_path),
+                })
         # remove old gcov files
         for f in self.gcov_files:
             if os.path.exists(f['data_path']):
                 os.remove(f['data_path'])
 
+    def _ref(self, i):
+        """ Returns reference data for i-th gcov file, loads them and lines to check on the first call
+        """
+        d = self.gcov_files[i]
+        if 'ref_data' not in d:
+            ref_data = d['ref_data_loader']()
+            d['ref_data'] = ref_data
+            # lines executed only once
+            d['c_lines'] = None
+            if self.CONST_LINES_START[i] is not None:
+                d['c_lines'] = ref_data.get_lines_coverage(d['src_path'], self.CONST_LINES_START[i], self.CONST_LINES_END[i])
+            # lines executed every gcov dump cycle
+            d['d_lines'] = ref_data.get_lines_coverage(d['src_path'], self.DYN_LINES_START[i], self.DYN_LINES_END[i])
+        return d['ref_data']
+
     def test_simple_gdb(self):
         """
             This test checks that GCOV data can be dumped by means of GDB
@@ -236,19 +328,25 @@ class GcovTestsImpl:
             self.step()
             self.gdb.gcov_dump(False)
             # parse and check gcov data
-            gcov_data_files = []
-            for f in self.gcov_files:
-                gcov_data_files.append(GcovDataFile(self.toolchain, f['data_path'], self.src_dirs,
-                                        self.proj_path, self.test_app_cfg.build_obj_dir()))
+            gcov_names = gcov_batch(self.toolchain, [f['data_path'] for f in self.gcov_files])
             if i == 0:
                 # after the first test iteration gcov data should be equal to reference ones
-                for k in range(len(gcov_data_files)):
-                    self.assertEqual(gcov_data_files[k], self.gcov_files[k]['ref_data'])
+                for k in range(len(gcov_names)):
+                    gcov_data = GcovDataFile(self.toolchain, gcov_names[k], self.src_dirs, self.proj_path, self.obj_dir)
+                    self.assertEqual(gcov_data, self._ref(k))
             else:
-                for n in range(len(gcov_data_files)):
+                # full data have been checked on the first iteration, so now read only lines of interest
+                for n in range(len(gcov_names)):
+                    ranges = {}
+                    if self.gcov_files[n]['c_lines']:
+                        ranges['c_lines'] = (self.CONST_LINES_START[n], self.CONST_LINES_END[n])
+                    if self.gcov_files[n]['d_lines']:
+                        ranges['d_lines'] = (self.DYN_LINES_START[n], self.DYN_LINES_END[n])
+                    lines_cov = get_gcov_lines_coverage(gcov_names[n], self.gcov_files[n]['src_path'], ranges,
+                                                        self.proj_path, self.obj_dir)
                     if self.gcov_files[n]['c_lines']:
                         # check constant lines
-                        c_lines = gcov_data_files[n].get_lines_coverage(self.gcov_files[n]['src_path'], self.CONST_LINES_START[n], self.CONST_LINES_END[n])
+                        c_lines = lines_cov['c_lines']
                         self.assertNotEqual(len(c_lines), 0)
                         self.assertEqual(len(c_lines), len(self.gcov_files[n]['c_lines']))
                         for k in range(len(c_lines)):
@@ -256,7 +354,7 @@ class GcovTestsImpl:
                             self.assertEqual(self.gcov_files[n]['c_lines'][k][1], c_lines[k][1])
                     if self.gcov_files[n]['d_lines']:
                         # check dynamic lines
-                        d_lines = gcov_data_files[n].get_lines_coverage(self.gcov_files[n]['src_path'], self.DYN_LINES_START[n], self.DYN_LINES_END[n])
+                        d_lines = lines_cov['d_lines']
                         self.assertNotEqual(len(d_lines), 0)
                         self.assertEqual(len(d_lines), len(self.gcov_files[n]['d_lines']))
                         for k in range(len(d_lines)):
@@ -282,18 +380,10 @@ class GcovTestsImpl:
         self.stop_exec()
         self.oocd.gcov_dump(False)
         # parse and check gcov data
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'gcov_tests.c.gcda')
-        ref_data_path = os.path.join(self.test_app_cfg.build_src_dir(), 'main', 'gcov_tests.c.gcov.json')
-        f = GcovDataFile(self.toolchain, os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path)), self.src_dirs,
-                        self.proj_path, self.test_app_cfg.build_obj_dir())
-        f2 = GcovDataFile(self.toolchain, ref_data_path, self.src_dirs, self.proj_path)
-        self.assertEqual(f, f2)
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'helper_funcs.c.gcda')
-        ref_data_path = os.path.join(self.test_app_cfg.build_src_dir(), 'main', 'helper_funcs.c.gcov.json')
-        f = GcovDataFile(self.toolchain, os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path)), self.src_dirs,
-                        self.proj_path, self.test_app_cfg.build_obj_dir())
-        f2 = GcovDataFile(self.toolchain, ref_data_path, self.src_dirs, self.proj_path)
-        self.assertEqual(f, f2)
+        gcov_names = gcov_batch(self.toolchain, [self._gcda_paths['gcov_tests'], self._gcda_paths['helper_funcs']])
+        for k in range(len(gcov_names)):
+            f = GcovDataFile(self.toolchain, gcov_names[k], self.src_dirs, self.proj_path, self.obj_dir)
+            self.assertEqual(f, self._ref(k))
 
     def test_on_the_fly_gdb(self):
         """
@@ -316,10 +406,8 @@ class GcovTestsImpl:
 
         # do not check gcov data, because its hard to precdict their contents
         # just check that files exist, contents are checked in test_simple_xxx tests
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'gcov_tests.c.gcda')
-        self.assertTrue(os.path.exists(os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path))))
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'helper_funcs.c.gcda')
-        self.assertTrue(os.path.exists(os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path))))
+        self.assertTrue(os.path.exists(self._gcda_paths['gcov_tests']))
+        self.assertTrue(os.path.exists(self._gcda_paths['helper_funcs']))
 
     def test_on_the_fly_oocd(self):
         """
@@ -340,10 +428,8 @@ class GcovTestsImpl:
         self.assertEqual(state, dbg.TARGET_STATE_RUNNING)
         # do not check gcov data, because its hard to precdict their contents
         # just check that files exist, contents are checked in test_simple_xxx tests
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'gcov_tests.c.gcda')
-        self.assertTrue(os.path.exists(os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path))))
-        data_path = os.path.join(self.test_app_cfg.build_obj_dir(), 'esp-idf', 'main', 'CMakeFiles', MAIN_COMP_BUILD_DIR_NAME, 'helper_funcs.c.gcda')
-        self.assertTrue(os.path.exists(os.path.join(self.gcov_prefix, self.strip_gcov_path(data_path))))
+        self.assertTrue(os.path.exists(self._gcda_paths['gcov_tests']))
+        self.assertTrue(os.path.exists(self._gcda_paths['helper_funcs']))
 
 ########################################################################
 #              TESTS DEFINITION WITH SPECIAL TESTS                     #